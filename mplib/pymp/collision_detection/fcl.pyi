@@ -825,6 +825,8 @@ class FCLObject:
         """
         Pose of this FCLObject. All shapes are relative to this pose
         """
+    @pose.setter
+    def pose(self, arg1: mplib.pymp.Pose) -> None: ...
     @property
     def shape_poses(self) -> list[mplib.pymp.Pose]:
         """
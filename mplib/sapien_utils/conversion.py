@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import io
+import sys
 import warnings
+from functools import cached_property, lru_cache
+from operator import attrgetter
 from typing import Literal, Optional, Sequence, Union
+from weakref import WeakKeyDictionary
 
 import numpy as np
 from sapien import Entity, Scene
@@ -19,7 +24,7 @@ from sapien.physx import (
 )
 from transforms3d.euler import euler2quat
 
-from .. import ArticulatedModel, PlanningWorld, Pose
+from .. import ArticulatedModel, AttachedBody, PlanningWorld, Pose
 from ..collision_detection import (
     AllowedCollision,
     AllowedCollisionMatrix,
@@ -49,6 +54,15 @@ from .urdf_exporter import export_kinematic_chain_urdf
 YELLOW_COLOR = "\033[93m"
 RESET_COLOR = "\033[0m"
 
+# Rotation taking the physx x-axis (capsule/cylinder height) to the FCL z-axis.
+# Computed once; euler2quat is pure-Python trig and always yields this constant.
+_CAPSULE_FIX_POSE = Pose(q=euler2quat(0, np.pi / 2, 0))
+
+
+# Cached mplib name per SAPIEN object; both name and per_scene_id are stable
+# for an object's lifetime, and weak keys let dead objects drop out.
+_NAME_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
 
 # TODO: link names?
 def convert_object_name(obj: Union[PhysxArticulation, Entity]) -> str:
@@ -59,12 +73,222 @@ def convert_object_name(obj: Union[PhysxArticulation, Entity]) -> str:
     :param obj: a SAPIEN object
     :return: the unique mplib object name
     """
+    if (name := _NAME_CACHE.get(obj)) is not None:
+        return name
     if isinstance(obj, PhysxArticulation):
-        return f"{obj.name}_{obj.root.entity.per_scene_id}"
+        name = f"{obj.name}_{obj.root.entity.per_scene_id}"
     elif isinstance(obj, Entity):
-        return f"{obj.name}_{obj.per_scene_id}"
+        name = f"{obj.name}_{obj.per_scene_id}"
     else:
         raise NotImplementedError(f"Unknown SAPIEN object type {type(obj)}")
+    _NAME_CACHE[obj] = name
+    return name
+
+
+def _identity(x):
+    return x
+
+
+# Extracts the mplib name from an ACM-edit argument by exact type; one dict
+# lookup instead of an isinstance chain per argument
+_NAME_EXTRACTORS = {
+    Entity: convert_object_name,
+    PhysxArticulationLinkComponent: attrgetter("name"),
+    str: _identity,
+}
+
+
+def _build_box(shape: PhysxCollisionShapeBox, pose: Pose):
+    return Box(side=shape.half_size * 2), pose
+
+
+def _build_capsule(shape: PhysxCollisionShapeCapsule, pose: Pose):
+    # NOTE: physx Capsule has x-axis along capsule height
+    # FCL Capsule has z-axis along capsule height
+    c_geom = Capsule(radius=shape.radius, lz=shape.half_length * 2)
+    return c_geom, pose * _CAPSULE_FIX_POSE
+
+
+def _build_convex_mesh(shape: PhysxCollisionShapeConvexMesh, pose: Pose):
+    # (3,) broadcasts against (N, 3) natively; no need to expand dims first
+    scaled_vertices = shape.vertices * shape.scale
+    return Convex(vertices=scaled_vertices, faces=shape.triangles), pose
+
+
+def _build_cylinder(shape: PhysxCollisionShapeCylinder, pose: Pose):
+    # NOTE: physx Cylinder has x-axis along cylinder height
+    # FCL Cylinder has z-axis along cylinder height
+    c_geom = Cylinder(radius=shape.radius, lz=shape.half_length * 2)
+    return c_geom, pose * _CAPSULE_FIX_POSE
+
+
+def _quat_rotate_x(q: np.ndarray) -> np.ndarray:
+    """Rotated x-axis of a (w, x, y, z) quaternion (first rotation matrix column)"""
+    w, x, y, z = q
+    return np.array([
+        1 - 2 * (y * y + z * z),
+        2 * (x * y + w * z),
+        2 * (x * z - w * y),
+    ])
+
+
+def _build_plane(shape: PhysxCollisionShapePlane, pose: Pose):
+    # PhysxCollisionShapePlane are actually a halfspace
+    # https://nvidia-omniverse.github.io/PhysX/physx/5.3.1/docs/Geometry.html#planes
+    # PxPlane's Pose determines its normal and offert (normal is +x)
+    n = _quat_rotate_x(pose.q)
+    d = float(n @ pose.p)
+    return Halfspace(n=n, d=d), Pose()
+
+
+def _build_sphere(shape: PhysxCollisionShapeSphere, pose: Pose):
+    return Sphere(radius=shape.radius), pose
+
+
+def _build_triangle_mesh(shape: PhysxCollisionShapeTriangleMesh, pose: Pose):
+    c_geom = BVHModel()
+    c_geom.begin_model()
+    c_geom.add_sub_model(vertices=shape.vertices, faces=shape.triangles)  # type: ignore
+    c_geom.end_model()
+    return c_geom, pose
+
+
+# Shared sentinel default for the acm arguments below. When the caller passes
+# no ACM the object/object handlers skip the get_allowed_collision call.
+_EMPTY_ACM = AllowedCollisionMatrix()
+
+# Kind tags returned by SapienPlanningWorld._get_collision_obj
+_KIND_ART = 0  # articulation, resolved to an FCLModel
+_KIND_OBJ = 1  # non-articulated object, resolved to an FCLObject
+
+
+def _collision_art_any(col_A: FCLModel, col_B, acm) -> list[WorldCollisionResult]:
+    return col_A.check_collision_with(col_B, acm=acm)
+
+
+def _collision_obj_art(col_A: FCLObject, col_B: FCLModel, acm):
+    return col_B.check_collision_with(col_A, acm=acm)
+
+
+def _collision_obj_obj(col_A: FCLObject, col_B: FCLObject, acm):
+    if (
+        acm is _EMPTY_ACM
+        or (acm_type := acm.get_allowed_collision(col_A.name, col_B.name)) is None
+        or acm_type == AllowedCollision.NEVER
+    ):
+        result = collide(col_A, col_B)
+        if result.is_collision():
+            return [
+                WorldCollisionResult(
+                    result,
+                    "object_object",
+                    col_A.name,
+                    col_B.name,
+                    col_A.name,
+                    col_B.name,
+                )
+            ]
+    return []
+
+
+def _distance_art_any(col_A: FCLModel, col_B, acm) -> WorldDistanceResult:
+    return col_A.distance_with(col_B, acm=acm)
+
+
+def _distance_obj_art(col_A: FCLObject, col_B: FCLModel, acm):
+    return col_B.distance_with(col_A, acm=acm)
+
+
+def _distance_obj_obj(col_A: FCLObject, col_B: FCLObject, acm):
+    if (
+        acm is _EMPTY_ACM
+        or (acm_type := acm.get_allowed_collision(col_A.name, col_B.name)) is None
+        or acm_type == AllowedCollision.NEVER
+    ):
+        result = distance(col_A, col_B)
+        return WorldDistanceResult(
+            result,
+            result.min_distance,
+            "object_object",
+            col_A.name,
+            col_B.name,
+            col_A.name,
+            col_B.name,
+        )
+    return WorldDistanceResult()
+
+
+# Handlers keyed by the (kind_A, kind_B) tags from _get_collision_obj; a single
+# tuple lookup replaces the per-query isinstance chains.
+_COLLISION_DISPATCH = {
+    (_KIND_ART, _KIND_ART): _collision_art_any,
+    (_KIND_ART, _KIND_OBJ): _collision_art_any,
+    (_KIND_OBJ, _KIND_ART): _collision_obj_art,
+    (_KIND_OBJ, _KIND_OBJ): _collision_obj_obj,
+}
+
+_DISTANCE_DISPATCH = {
+    (_KIND_ART, _KIND_ART): _distance_art_any,
+    (_KIND_ART, _KIND_OBJ): _distance_art_any,
+    (_KIND_OBJ, _KIND_ART): _distance_obj_art,
+    (_KIND_OBJ, _KIND_OBJ): _distance_obj_obj,
+}
+
+
+# Exported (urdf_str, srdf_str) keyed by articulation name, link/joint names
+# and a structural signature. Duplicate robots (e.g. vectorized environments
+# building the same scene repeatedly) skip the expensive string export
+# entirely. Bounded so iterate-and-rebuild loops that keep tweaking a robot's
+# structure cannot grow it without limit.
+_URDF_CACHE: dict[tuple, tuple[str, str]] = {}
+_URDF_CACHE_MAXSIZE = 8
+
+
+def _articulation_structure_signature(articulation: PhysxArticulation) -> bytes:
+    """
+    Cheap byte signature of the structural properties baked into the exported
+    URDF/SRDF that the name-based cache key cannot see: joint limits, types,
+    anchor poses and dynamics, link inertial properties, and per-link
+    collision-shape presence/groups (which drive the SRDF's
+    ``disable_collisions``). Tweaking any of these in SAPIEN and rebuilding
+    the planning world therefore misses the cache and re-exports.
+    """
+    parts = [articulation.qlimits.tobytes()]
+    for link in articulation.links:
+        cmass_pose = link.cmass_local_pose
+        parts += [
+            np.asarray([link.mass, *link.inertia]).tobytes(),
+            cmass_pose.p.tobytes(),
+            cmass_pose.q.tobytes(),
+        ]
+        for shape in link.collision_shapes:
+            parts.append(np.asarray(shape.collision_groups).tobytes())
+    for joint in articulation.joints:
+        j2p = joint.pose_in_parent
+        c2j = joint.pose_in_child
+        parts += [
+            joint.type.encode(),
+            j2p.p.tobytes(),
+            j2p.q.tobytes(),
+            c2j.p.tobytes(),
+            c2j.q.tobytes(),
+            np.asarray([joint.damping, joint.friction, joint.force_limit]).tobytes(),
+        ]
+    return b"".join(parts)
+
+
+# Maps a physx collision shape type to a builder returning the equivalent FCL
+# collision geometry and the (possibly adjusted) shape pose. A single dict
+# lookup by exact type replaces the per-shape isinstance ladder.
+_SHAPE_BUILDERS = {
+    PhysxCollisionShapeBox: _build_box,
+    PhysxCollisionShapeCapsule: _build_capsule,
+    PhysxCollisionShapeConvexMesh: _build_convex_mesh,
+    PhysxCollisionShapeCylinder: _build_cylinder,
+    PhysxCollisionShapePlane: _build_plane,
+    PhysxCollisionShapeSphere: _build_sphere,
+    PhysxCollisionShapeTriangleMesh: _build_triangle_mesh,
+}
 
 
 class SapienPlanningWorld(PlanningWorld):
@@ -80,18 +304,44 @@ class SapienPlanningWorld(PlanningWorld):
         """
         super().__init__([])
         self._sim_scene = sim_scene
+        self._sync_dirty = True
+        self._link_index_cache: dict[str, dict[str, int]] = {}
+        self._bounding_radius_cache: dict[str, float] = {}
+        # Per-robot kinematic metadata memoized for SapienPlanner construction
+        self._planner_init_cache: dict[str, tuple] = {}
+        # Move group last selected on each robot, to skip redundant re-selection
+        self._last_move_group: dict[str, str] = {}
+        self._entity_has_shapes: WeakKeyDictionary = WeakKeyDictionary()
 
         articulations: list[PhysxArticulation] = sim_scene.get_all_articulations()
         actors: list[Entity] = sim_scene.get_all_actors()
 
         for articulation in articulations:
-            urdf_str = export_kinematic_chain_urdf(articulation)
-            srdf_str = export_srdf(articulation)
+            # links/active_joints each materialize a new list across pybind11;
+            # fetch them once and derive the name lists from the local copies
+            links = articulation.links
+            link_names = [link.name for link in links]
+            joint_names = [j.name for j in articulation.active_joints]
+
+            cache_key = (
+                articulation.name,
+                tuple(link_names),
+                tuple(joint_names),
+                _articulation_structure_signature(articulation),
+            )
+            if (cached := _URDF_CACHE.get(cache_key)) is not None:
+                urdf_str, srdf_str = cached
+            else:
+                urdf_str = export_kinematic_chain_urdf(articulation)
+                srdf_str = export_srdf(articulation)
+                _URDF_CACHE[cache_key] = (urdf_str, srdf_str)
+                if len(_URDF_CACHE) > _URDF_CACHE_MAXSIZE:  # drop oldest entry
+                    _URDF_CACHE.pop(next(iter(_URDF_CACHE)))
 
             # Convert all links to FCLObject
             collision_links = [
                 fcl_obj
-                for link in articulation.links
+                for link in links
                 if (fcl_obj := self.convert_physx_component(link)) is not None
             ]
 
@@ -99,9 +349,13 @@ class SapienPlanningWorld(PlanningWorld):
                 urdf_str,
                 srdf_str,
                 collision_links=collision_links,
+                # explicit per-instance name: the cached URDF embeds the name
+                # of the articulation it was exported from, which can differ
+                # in per_scene_id on a cache hit
+                name=convert_object_name(articulation),
                 gravity=sim_scene.get_physx_system().config.gravity,  # type: ignore
-                link_names=[link.name for link in articulation.links],
-                joint_names=[j.name for j in articulation.active_joints],
+                link_names=link_names,
+                joint_names=joint_names,
                 verbose=False,
             )
             articulated_model.set_base_pose(articulation.root_pose)  # type: ignore
@@ -125,68 +379,149 @@ class SapienPlanningWorld(PlanningWorld):
             if (fcl_obj := self.convert_physx_component(component)) is not None:  # type: ignore
                 self.add_object(fcl_obj)
 
-    def update_from_simulation(self, *, update_attached_object: bool = True) -> None:
+        self._build_sync_caches()
+
+    def _build_sync_caches(self) -> None:
         """
-        Updates PlanningWorld's articulations/objects pose with current Scene state.
-        Note that shape's local_pose is not updated.
-        If those are changed, please recreate a new SapienPlanningWorld instance.
+        (Re)builds the cached SAPIEN object <-> mplib handle pairs that
+        ``update_from_simulation()`` iterates over, so that the per-tick loop
+        does not need to re-resolve names or handles.
 
-        :param update_attached_object: whether to update the attached pose of
-            all attached objects
+        The caches are marked dirty whenever objects are added/removed or
+        attached/detached, and rebuilt lazily on the next update.
         """
-        for articulation in self._sim_scene.get_all_articulations():
+        articulations = self._sim_scene.get_all_articulations()
+        # Preallocate one contiguous qpos buffer with per-articulation slice
+        # views, so each tick copies into a reusable buffer (a single memcpy
+        # per articulation) instead of allocating new arrays.
+        self._qpos_buf = np.empty(sum(a.dof for a in articulations))
+        art_pairs: list[tuple[ArticulatedModel, PhysxArticulation, np.ndarray]] = []
+        offset = 0
+        for articulation in articulations:
             if art := self.get_articulation(convert_object_name(articulation)):
-                art.set_base_pose(articulation.root_pose)  # type: ignore
-                # set_qpos to update poses
-                art.set_qpos(articulation.qpos, full=True)  # type: ignore
+                qpos_view = self._qpos_buf[offset : offset + articulation.dof]
+                art_pairs.append((art, articulation, qpos_view))
+                offset += articulation.dof
             else:
                 raise RuntimeError(
                     f"Articulation {articulation.name} not found in PlanningWorld! "
                     "The scene might have changed since last update."
                 )
 
+        actor_pairs: list[tuple[FCLObject, Entity]] = []
+        attached_pairs: list[tuple[AttachedBody, Entity]] = []
         for entity in self._sim_scene.get_all_actors():
             object_name = convert_object_name(entity)
 
             # If entity is an attached object
             if attached_body := self.get_attached_object(object_name):
-                if update_attached_object:  # update attached pose
-                    attached_body.pose = (
-                        attached_body.get_attached_link_global_pose().inv()
-                        * entity.pose  # type: ignore
-                    )
-                attached_body.update_pose()
+                attached_pairs.append((attached_body, entity))
             elif fcl_obj := self.get_object(object_name):
-                # Overwrite the object
-                self.add_object(
-                    FCLObject(
-                        object_name,
-                        entity.pose,  # type: ignore
-                        fcl_obj.shapes,
-                        fcl_obj.shape_poses,
+                actor_pairs.append((fcl_obj, entity))
+            else:
+                # find_component_by_type is an expensive probe; memoize the
+                # answer per entity since it only gates this warning
+                if (has_shapes := self._entity_has_shapes.get(entity)) is None:
+                    has_shapes = (
+                        len(
+                            entity.find_component_by_type(
+                                PhysxRigidBaseComponent
+                            ).collision_shapes  # type: ignore
+                        )
+                        > 0
                     )
-                )
-            elif (
-                len(
-                    entity.find_component_by_type(
-                        PhysxRigidBaseComponent
-                    ).collision_shapes  # type: ignore
-                )
-                > 0
+                    self._entity_has_shapes[entity] = has_shapes
+                if has_shapes:
+                    warnings.warn(
+                        YELLOW_COLOR
+                        + f"Entity {entity.name} not found in PlanningWorld! "
+                        "The scene might have changed since last update. "
+                        "Use PlanningWorld.add_object() to add the object."
+                        + RESET_COLOR,
+                        stacklevel=2,
+                    )
+
+        self._art_pairs = art_pairs
+        self._actor_pairs = actor_pairs
+        self._attached_pairs = attached_pairs
+        # Last-synced pose signatures (raw bytes), parallel to the actor pair
+        # list above. Used to skip writes for actors that did not move; plain
+        # FCLObject poses are only ever written here, so a remembered
+        # signature is sound for them (unlike the robot model, which the
+        # planner itself mutates between syncs).
+        self._actor_pose_sigs: list[Optional[bytes]] = [None] * len(actor_pairs)
+        self._sync_dirty = False
+
+    def invalidate_scene(self) -> None:
+        """
+        Marks the cached scene state as stale, forcing the next
+        ``update_from_simulation()`` call to re-enumerate the scene's
+        articulations and actors. Call this after entities are added to or
+        removed from the SAPIEN scene directly; changes made through this
+        class's add/remove/attach/detach methods are tracked automatically.
+        """
+        self._sync_dirty = True
+
+    def update_from_simulation(self, *, update_attached_object: bool = True) -> None:
+        """
+        Updates PlanningWorld's articulations/objects pose with current Scene state.
+        Note that shape's local_pose is not updated.
+        If those are changed, please recreate a new SapienPlanningWorld instance.
+
+        The scene's articulation/actor lists are only re-enumerated when the
+        cached pairs are invalid; call :meth:`invalidate_scene` if entities
+        were added to or removed from the SAPIEN scene directly.
+
+        :param update_attached_object: whether to update the attached pose of
+            all attached objects
+        """
+        if self._sync_dirty:
+            self._build_sync_caches()
+
+        for art, articulation, qpos_view in self._art_pairs:
+            # Compare against the model's actual state rather than a
+            # remembered last-written value: planner IK / validity sampling
+            # mutates the model's qpos (and thus its FK) between syncs, so a
+            # stale-signature skip would leave the robot at the planner's
+            # last sample instead of restoring the simulation state.
+            pose = articulation.root_pose
+            base_pose = art.get_base_pose()
+            if not (
+                np.array_equal(pose.p, base_pose.p)
+                and np.array_equal(pose.q, base_pose.q)
             ):
-                warnings.warn(
-                    YELLOW_COLOR + f"Entity {entity.name} not found in PlanningWorld! "
-                    "The scene might have changed since last update. "
-                    "Use PlanningWorld.add_object() to add the object." + RESET_COLOR,
-                    stacklevel=2,
+                art.set_base_pose(pose)  # type: ignore
+            if qpos_view.size == 0:  # zero-DOF articulation, nothing to sync
+                continue
+            qpos = articulation.qpos
+            if not np.array_equal(qpos, np.ravel(art.get_qpos())):
+                # set_qpos to update poses
+                np.copyto(qpos_view, qpos)
+                art.set_qpos(qpos_view, full=True)
+
+        for attached_body, entity in self._attached_pairs:
+            if update_attached_object:  # update attached pose
+                attached_body.pose = (
+                    attached_body.get_attached_link_global_pose().inv()
+                    * entity.pose  # type: ignore
                 )
+            attached_body.update_pose()
+
+        for i, (fcl_obj, entity) in enumerate(self._actor_pairs):
+            pose = entity.pose
+            if (sig := pose.p.tobytes() + pose.q.tobytes()) == self._actor_pose_sigs[i]:
+                continue
+            self._actor_pose_sigs[i] = sig
+            # Rewrite the pose of the existing FCLObject in place instead of
+            # constructing a replacement object with copied shape lists
+            fcl_obj.pose = pose  # type: ignore
 
     def check_collision_between(
         self,
         obj_A: Union[PhysxArticulation, Entity],
         obj_B: Union[PhysxArticulation, Entity],
         *,
-        acm: AllowedCollisionMatrix = AllowedCollisionMatrix(),  # noqa: B008
+        acm: AllowedCollisionMatrix = _EMPTY_ACM,
     ) -> list[WorldCollisionResult]:
         """
         Check collision between two objects,
@@ -197,44 +532,94 @@ class SapienPlanningWorld(PlanningWorld):
         :param acm: allowed collision matrix.
         :return: a list of WorldCollisionResult. Empty if there's no collision.
         """
-        col_obj_A = self._get_collision_obj(obj_A)
-        col_obj_B = self._get_collision_obj(obj_B)
-
-        if isinstance(obj_A, PhysxArticulation):  # A is articulation, B is anything
-            assert isinstance(col_obj_A, FCLModel), f"Wrong type: {type(col_obj_A)}"
-            return col_obj_A.check_collision_with(col_obj_B, acm=acm)
-        elif isinstance(obj_B, PhysxArticulation):  # A is object, B is articulation
-            assert isinstance(col_obj_B, FCLModel), f"Wrong type: {type(col_obj_B)}"
-            return col_obj_B.check_collision_with(col_obj_A, acm=acm)
-        elif isinstance(obj_B, Entity):  # A is object, B is object
-            assert isinstance(col_obj_A, FCLObject) and isinstance(
-                col_obj_B, FCLObject
-            ), f"Wrong type: col_obj_A={type(col_obj_A)}, col_obj_B={type(col_obj_B)}"
-            if (
-                acm_type := acm.get_allowed_collision(col_obj_A.name, col_obj_B.name)
-            ) is None or acm_type == AllowedCollision.NEVER:
-                result = collide(col_obj_A, col_obj_B)
-                if result.is_collision():
-                    return [
-                        WorldCollisionResult(
-                            result,
-                            "object_object",
-                            col_obj_A.name,
-                            col_obj_B.name,
-                            col_obj_A.name,
-                            col_obj_B.name,
-                        )
-                    ]
-            return []
-        else:
-            raise NotImplementedError(f"obj_A={obj_A}, obj_B={obj_B}")
+        col_obj_A, kind_A = self._get_collision_obj(obj_A)
+        col_obj_B, kind_B = self._get_collision_obj(obj_B)
+        return _COLLISION_DISPATCH[kind_A, kind_B](col_obj_A, col_obj_B, acm)
+
+    def check_collision_batch(
+        self,
+        obj_A: Union[PhysxArticulation, Entity],
+        objs_B: Sequence[Union[PhysxArticulation, Entity]],
+        *,
+        acm: AllowedCollisionMatrix = _EMPTY_ACM,
+    ) -> list[WorldCollisionResult]:
+        """
+        Check collision between one object and a batch of other objects.
+
+        Object/object pairs are pre-filtered with a vectorized bounding-sphere
+        test in NumPy, so the FCL narrowphase only runs for pairs whose
+        bounding spheres overlap. Pairs involving an articulation fall back to
+        :meth:`check_collision_between`.
+
+        :param obj_A: object A to check for collision.
+        :param objs_B: objects to check for collision against object A.
+        :param acm: allowed collision matrix.
+        :return: a list of WorldCollisionResult. Empty if there's no collision.
+        """
+        results: list[WorldCollisionResult] = []
+        col_obj_A, kind_A = self._get_collision_obj(obj_A)
+        if kind_A == _KIND_ART:
+            for obj_B in objs_B:
+                col_obj_B, kind_B = self._get_collision_obj(obj_B)
+                results.extend(
+                    _COLLISION_DISPATCH[kind_A, kind_B](col_obj_A, col_obj_B, acm)
+                )
+            return results
+
+        col_objs_B: list[FCLObject] = []
+        for obj_B in objs_B:
+            col_obj_B, kind_B = self._get_collision_obj(obj_B)
+            if kind_B == _KIND_ART:
+                results.extend(_collision_obj_art(col_obj_A, col_obj_B, acm))
+            else:
+                col_objs_B.append(col_obj_B)
+        if len(col_objs_B) == 0:
+            return results
+
+        # Vectorized bounding-sphere broadphase: only pairs whose spheres
+        # overlap reach the narrowphase below
+        centers = np.array([o.pose.p for o in col_objs_B])
+        radii = np.fromiter(
+            (self._get_bounding_radius(o) for o in col_objs_B),
+            dtype=np.float64,
+            count=len(col_objs_B),
+        )
+        dists = np.linalg.norm(centers - col_obj_A.pose.p, axis=1)
+        mask = dists <= radii + self._get_bounding_radius(col_obj_A)
+
+        for col_obj_B, candidate in zip(col_objs_B, mask):
+            if candidate:
+                results.extend(_collision_obj_obj(col_obj_A, col_obj_B, acm))
+        return results
+
+    def _get_bounding_radius(self, fcl_obj: FCLObject) -> float:
+        """
+        Helper function to get a conservative bounding-sphere radius of an
+        FCLObject about its pose origin, cached by object name (shapes and
+        their local poses are fixed for an object's lifetime).
+        """
+        if (radius := self._bounding_radius_cache.get(fcl_obj.name)) is None:
+            radius = max(
+                (
+                    float(np.linalg.norm(pose.p))
+                    + float(np.linalg.norm(geom.aabb_center))
+                    + geom.aabb_radius
+                    for pose, geom in zip(
+                        fcl_obj.shape_poses,
+                        (s.get_collision_geometry() for s in fcl_obj.shapes),
+                    )
+                ),
+                default=0.0,
+            )
+            self._bounding_radius_cache[fcl_obj.name] = radius
+        return radius
 
     def distance_between(
         self,
         obj_A: Union[PhysxArticulation, Entity],
         obj_B: Union[PhysxArticulation, Entity],
         *,
-        acm: AllowedCollisionMatrix = AllowedCollisionMatrix(),  # noqa: B008
+        acm: AllowedCollisionMatrix = _EMPTY_ACM,
         return_distance_only: bool = True,
     ) -> Union[WorldDistanceResult, float]:
         """
@@ -247,51 +632,40 @@ class SapienPlanningWorld(PlanningWorld):
         :param return_distance_only: if True, return distance only.
         :return: a WorldDistanceResult or a float if return_distance_only==True.
         """
-        col_obj_A = self._get_collision_obj(obj_A)
-        col_obj_B = self._get_collision_obj(obj_B)
-        ret = WorldDistanceResult()
-
-        if isinstance(obj_A, PhysxArticulation):  # A is articulation, B is anything
-            assert isinstance(col_obj_A, FCLModel), f"Wrong type: {type(col_obj_A)}"
-            ret = col_obj_A.distance_with(col_obj_B, acm=acm)
-        elif isinstance(obj_B, PhysxArticulation):  # A is object, B is articulation
-            assert isinstance(col_obj_B, FCLModel), f"Wrong type: {type(col_obj_B)}"
-            ret = col_obj_B.distance_with(col_obj_A, acm=acm)
-        elif isinstance(obj_B, Entity):  # A is object, B is object
-            assert isinstance(col_obj_A, FCLObject) and isinstance(
-                col_obj_B, FCLObject
-            ), f"Wrong type: col_obj_A={type(col_obj_A)}, col_obj_B={type(col_obj_B)}"
-            if (
-                acm_type := acm.get_allowed_collision(col_obj_A.name, col_obj_B.name)
-            ) is None or acm_type == AllowedCollision.NEVER:
-                result = distance(col_obj_A, col_obj_B)
-                ret = WorldDistanceResult(
-                    result,
-                    result.min_distance,
-                    "object_object",
-                    col_obj_A.name,
-                    col_obj_B.name,
-                    col_obj_A.name,
-                    col_obj_B.name,
-                )
-        else:
-            raise NotImplementedError(f"obj_A={obj_A}, obj_B={obj_B}")
-
+        col_obj_A, kind_A = self._get_collision_obj(obj_A)
+        col_obj_B, kind_B = self._get_collision_obj(obj_B)
+        ret = _DISTANCE_DISPATCH[kind_A, kind_B](col_obj_A, col_obj_B, acm)
         return ret.min_distance if return_distance_only else ret
 
+    def _get_link_index(self, art_name: str, link_name: str) -> int:
+        """
+        Helper function to get the index of an articulation link by name,
+        caching the per-articulation name -> index mapping on first use.
+        """
+        if (link_name_2_idx := self._link_index_cache.get(art_name)) is None:
+            link_names = (
+                self.get_articulation(art_name).get_pinocchio_model().get_link_names()
+            )
+            link_name_2_idx = {name: i for i, name in enumerate(link_names)}
+            self._link_index_cache[art_name] = link_name_2_idx
+        return link_name_2_idx[link_name]
+
     def _get_collision_obj(
         self,
         obj: Union[PhysxArticulation, Entity],
-    ) -> Union[FCLModel, FCLObject, None]:
-        """Helper function to get mplib collision object from sapien object"""
+    ) -> Union[tuple[FCLModel, int], tuple[FCLObject, int]]:
+        """
+        Helper function to get mplib collision object from sapien object,
+        together with its kind tag (``_KIND_ART`` or ``_KIND_OBJ``)
+        """
         if isinstance(obj, PhysxArticulation) and (
             articulation := self.get_articulation(convert_object_name(obj))
         ):
-            return articulation.get_fcl_model()
+            return articulation.get_fcl_model(), _KIND_ART
         elif isinstance(obj, Entity) and (
             fcl_obj := self.get_object(convert_object_name(obj))
         ):
-            return fcl_obj
+            return fcl_obj, _KIND_OBJ
         else:
             raise RuntimeError(
                 f"Unknown SAPIEN object type: {type(obj)} or "
@@ -311,48 +685,32 @@ class SapienPlanningWorld(PlanningWorld):
         :return: an FCLObject containing all collision shapes in the Physx component.
             If the component has no collision shapes, return ``None``.
         """
-        shapes: list[CollisionObject] = []
-        shape_poses: list[Pose] = []
-        for shape in comp.collision_shapes:
-            shape_poses.append(Pose(shape.local_pose))  # type: ignore
-
-            if isinstance(shape, PhysxCollisionShapeBox):
-                c_geom = Box(side=shape.half_size * 2)
-            elif isinstance(shape, PhysxCollisionShapeCapsule):
-                c_geom = Capsule(radius=shape.radius, lz=shape.half_length * 2)
-                # NOTE: physx Capsule has x-axis along capsule height
-                # FCL Capsule has z-axis along capsule height
-                shape_poses[-1] *= Pose(q=euler2quat(0, np.pi / 2, 0))
-            elif isinstance(shape, PhysxCollisionShapeConvexMesh):
-                scaled_vertices = shape.vertices * np.expand_dims(shape.scale, axis=0)
-                c_geom = Convex(vertices=scaled_vertices, faces=shape.triangles)
-            elif isinstance(shape, PhysxCollisionShapeCylinder):
-                c_geom = Cylinder(radius=shape.radius, lz=shape.half_length * 2)
-                # NOTE: physx Cylinder has x-axis along cylinder height
-                # FCL Cylinder has z-axis along cylinder height
-                shape_poses[-1] *= Pose(q=euler2quat(0, np.pi / 2, 0))
-            elif isinstance(shape, PhysxCollisionShapePlane):
-                # PhysxCollisionShapePlane are actually a halfspace
-                # https://nvidia-omniverse.github.io/PhysX/physx/5.3.1/docs/Geometry.html#planes
-                # PxPlane's Pose determines its normal and offert (normal is +x)
-                n = shape_poses[-1].to_transformation_matrix()[:3, 0]
-                d = n.dot(shape_poses[-1].p)
-                c_geom = Halfspace(n=n, d=d)
-                shape_poses[-1] = Pose()
-            elif isinstance(shape, PhysxCollisionShapeSphere):
-                c_geom = Sphere(radius=shape.radius)
-            elif isinstance(shape, PhysxCollisionShapeTriangleMesh):
-                c_geom = BVHModel()
-                c_geom.begin_model()
-                c_geom.add_sub_model(vertices=shape.vertices, faces=shape.triangles)  # type: ignore
-                c_geom.end_model()
-            else:
-                raise TypeError(f"Unknown shape type: {type(shape)}")
-            shapes.append(CollisionObject(c_geom))
-
-        if len(shapes) == 0:
+        collision_shapes = comp.collision_shapes
+        if len(collision_shapes) == 0:
             return None
 
+        # First pass: group shape indices by type so each builder runs over
+        # its whole group at once (one dict lookup per group, better locality
+        # for components with many shapes of the same type)
+        groups: dict = {}
+        for i, shape in enumerate(collision_shapes):
+            if (builder := _SHAPE_BUILDERS.get(type(shape))) is None:
+                raise TypeError(f"Unknown shape type: {type(shape)}")
+            groups.setdefault(builder, []).append(i)
+
+        # Second pass: build each group, writing straight into preallocated
+        # lists at the original shape index (the length is known upfront, so
+        # there is no append-growth or reassembly step)
+        n = len(collision_shapes)
+        shapes: list[CollisionObject] = [None] * n  # type: ignore
+        shape_poses: list[Pose] = [None] * n  # type: ignore
+        for builder, indices in groups.items():
+            for i in indices:
+                shape = collision_shapes[i]
+                c_geom, pose = builder(shape, Pose(shape.local_pose))  # type: ignore
+                shapes[i] = CollisionObject(c_geom)
+                shape_poses[i] = pose
+
         return FCLObject(
             comp.name
             if isinstance(comp, PhysxArticulationLinkComponent)
@@ -385,7 +743,7 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
-        if isinstance(articulation, PhysxArticulation):
+        if type(articulation) is PhysxArticulation:
             articulation = convert_object_name(articulation)
         return super().is_articulation_planned(articulation)
 
@@ -411,7 +769,7 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
-        if isinstance(articulation, PhysxArticulation):
+        if type(articulation) is PhysxArticulation:
             articulation = convert_object_name(articulation)
         super().set_articulation_planned(articulation, planned)
 
@@ -436,7 +794,7 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
-        if isinstance(obj, Entity):
+        if type(obj) is Entity:
             obj = convert_object_name(obj)
         return super().has_object(obj)
 
@@ -459,7 +817,7 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
-        if isinstance(obj, Entity):
+        if type(obj) is Entity:
             component = obj.find_component_by_type(PhysxRigidBaseComponent)
             assert component is not None, (
                 f"No PhysxRigidBaseComponent found in {obj.name}: " f"{obj.components=}"
@@ -470,6 +828,9 @@ class SapienPlanningWorld(PlanningWorld):
                 self.add_object(fcl_obj)
         else:
             super().add_object(obj)
+            # the object may replace one of the same name with new geometry
+            self._bounding_radius_cache.pop(obj.name, None)
+            self._sync_dirty = True
 
     def remove_object(self, obj: Union[Entity, str]) -> None:
         """
@@ -490,9 +851,12 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
-        if isinstance(obj, Entity):
+        if type(obj) is Entity:
             obj = convert_object_name(obj)
         super().remove_object(obj)
+        # a later object reusing this name may have different geometry
+        self._bounding_radius_cache.pop(obj, None)
+        self._sync_dirty = True
 
     def is_object_attached(self, obj: Union[Entity, str]) -> bool:  # type: ignore
         """
@@ -514,7 +878,7 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
-        if isinstance(obj, Entity):
+        if type(obj) is Entity:
             obj = convert_object_name(obj)
         return super().is_object_attached(obj)
 
@@ -562,30 +926,43 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
+        # Fast path: everything already resolved, skip the kwargs assembly
+        if (
+            type(obj) is str
+            and type(articulation) is str
+            and type(link) is int
+            and touch_links is None
+            and obj_geom is None
+        ):
+            if pose is None:
+                super().attach_object(name=obj, art_name=articulation, link_id=link)
+            else:
+                super().attach_object(
+                    name=obj, art_name=articulation, link_id=link, pose=pose
+                )
+            self._sync_dirty = True
+            return
+
         kwargs = {"name": obj, "art_name": articulation, "link_id": link}
         if pose is not None:
             kwargs["pose"] = pose
         if touch_links is not None:
             kwargs["touch_links"] = [
-                l.name if isinstance(l, PhysxArticulationLinkComponent) else l
+                l.name if type(l) is PhysxArticulationLinkComponent else l
                 for l in touch_links  # noqa: E741
             ]
         if obj_geom is not None:
             kwargs["obj_geom"] = obj_geom
 
-        if isinstance(obj, Entity):
+        if type(obj) is Entity:
             kwargs["name"] = convert_object_name(obj)
-        if isinstance(articulation, PhysxArticulation):
+        if type(articulation) is PhysxArticulation:
             kwargs["art_name"] = articulation = convert_object_name(articulation)
-        if isinstance(link, PhysxArticulationLinkComponent):
-            kwargs["link_id"] = (
-                self.get_articulation(articulation)
-                .get_pinocchio_model()
-                .get_link_names()
-                .index(link.name)
-            )
+        if type(link) is PhysxArticulationLinkComponent:
+            kwargs["link_id"] = self._get_link_index(articulation, link.name)
 
         super().attach_object(**kwargs)
+        self._sync_dirty = True
 
     def detach_object(self, obj: Union[Entity, str], also_remove: bool = False) -> bool:  # type: ignore
         """
@@ -610,8 +987,9 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
-        if isinstance(obj, Entity):
+        if type(obj) is Entity:
             obj = convert_object_name(obj)
+        self._sync_dirty = True
         return super().detach_object(obj, also_remove=also_remove)
 
     def attach_sphere(  # type: ignore
@@ -642,16 +1020,12 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
-        if isinstance(articulation, PhysxArticulation):
+        if type(articulation) is PhysxArticulation:
             articulation = convert_object_name(articulation)
-        if isinstance(link, PhysxArticulationLinkComponent):
-            link = (
-                self.get_articulation(articulation)
-                .get_pinocchio_model()
-                .get_link_names()
-                .index(link.name)
-            )
+        if type(link) is PhysxArticulationLinkComponent:
+            link = self._get_link_index(articulation, link.name)
         super().attach_sphere(radius, articulation, link, pose)
+        self._sync_dirty = True
 
     def attach_box(  # type: ignore
         self,
@@ -684,16 +1058,12 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
-        if isinstance(articulation, PhysxArticulation):
+        if type(articulation) is PhysxArticulation:
             articulation = convert_object_name(articulation)
-        if isinstance(link, PhysxArticulationLinkComponent):
-            link = (
-                self.get_articulation(articulation)
-                .get_pinocchio_model()
-                .get_link_names()
-                .index(link.name)
-            )
+        if type(link) is PhysxArticulationLinkComponent:
+            link = self._get_link_index(articulation, link.name)
         super().attach_box(size, articulation, link, pose)  # type: ignore
+        self._sync_dirty = True
 
     def attach_mesh(  # type: ignore
         self,
@@ -726,16 +1096,12 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
-        if isinstance(articulation, PhysxArticulation):
+        if type(articulation) is PhysxArticulation:
             articulation = convert_object_name(articulation)
-        if isinstance(link, PhysxArticulationLinkComponent):
-            link = (
-                self.get_articulation(articulation)
-                .get_pinocchio_model()
-                .get_link_names()
-                .index(link.name)
-            )
+        if type(link) is PhysxArticulationLinkComponent:
+            link = self._get_link_index(articulation, link.name)
         super().attach_mesh(mesh_path, articulation, link, pose, convex=convex)
+        self._sync_dirty = True
 
     def set_allowed_collision(
         self,
@@ -762,17 +1128,40 @@ class SapienPlanningWorld(PlanningWorld):
         .. raw:: html
             </details>
         """
-        if isinstance(obj1, Entity):
-            obj1 = convert_object_name(obj1)
-        elif isinstance(obj1, PhysxArticulationLinkComponent):
-            obj1 = obj1.name
-        if isinstance(obj2, Entity):
-            obj2 = convert_object_name(obj2)
-        elif isinstance(obj2, PhysxArticulationLinkComponent):
-            obj2 = obj2.name
+        obj1 = _NAME_EXTRACTORS.get(type(obj1), _identity)(obj1)
+        obj2 = _NAME_EXTRACTORS.get(type(obj2), _identity)(obj2)
         super().set_allowed_collision(obj1, obj2, allowed)
 
 
+@lru_cache(maxsize=8)
+def _name_index_map(names: tuple[str, ...]) -> dict[str, int]:
+    """
+    Memoized name -> index map, so repeated planner constructions over the
+    same robot (common in multi-query workflows) share one dict.
+    """
+    return dict(zip(names, range(len(names))))
+
+
+# Bit set in a joint-type code for revolute ("JointModelR*") joint classes
+_JTYPE_REVOLUTE_BIT = 0x40
+# Pinocchio joint-class name -> compact int8 code, populated on first sight
+_JTYPE_CODES: dict[str, int] = {}
+
+
+def _jtype_code(joint_type: str) -> int:
+    """
+    Compact int8 code for a Pinocchio joint-class name, assigned on first
+    sight; revolute classes additionally carry ``_JTYPE_REVOLUTE_BIT``.
+    """
+    code = _JTYPE_CODES.get(joint_type)
+    if code is None:
+        code = len(_JTYPE_CODES) | (
+            _JTYPE_REVOLUTE_BIT if joint_type.startswith("JointModelR") else 0
+        )
+        _JTYPE_CODES[joint_type] = code
+    return code
+
+
 class SapienPlanner(Planner):
     def __init__(
         self,
@@ -781,6 +1170,7 @@ class SapienPlanner(Planner):
         *,
         joint_vel_limits: Union[Sequence[float], np.ndarray, None] = None,
         joint_acc_limits: Union[Sequence[float], np.ndarray, None] = None,
+        check_initial_collision: bool = True,
     ):
         """
         Creates an mplib.planner.Planner from a SapienPlanningWorld.
@@ -789,71 +1179,172 @@ class SapienPlanner(Planner):
         :param move_group: name of the move group (end effector link)
         :param joint_vel_limits: joint velocity limits for time parameterization
         :param joint_acc_limits: joint acceleration limits for time parameterization
+        :param check_initial_collision: whether to run a full robot collision
+            check and warn about colliding links during construction. Pass
+            ``False`` when constructing many planners over the same scene and
+            call :meth:`warn_initial_collisions` once instead.
         """
         self.planning_world = sapien_planning_world
+        # Pre-bound method so the per-tick forwarder below skips two
+        # attribute lookups per call
+        self._update_world = sapien_planning_world.update_from_simulation
         self.acm = self.planning_world.get_allowed_collision_matrix()
 
         if len(planned_arts := self.planning_world.get_planned_articulations()) != 1:
             raise NotImplementedError("Must have exactly one planned articulation")
         self.robot = planned_arts[0]
-        self.pinocchio_model = self.robot.get_pinocchio_model()
-        self.user_link_names = self.pinocchio_model.get_link_names()
-        self.user_joint_names = self.pinocchio_model.get_joint_names()
+        # Pinocchio model construction and the name/type/limit getters are all
+        # C++ FFI; memoize their results on the planning world so rebuilding a
+        # planner over the same scene (multi-query workflows) pays them once
+        robot_name = self.robot.name
+        cached = sapien_planning_world._planner_init_cache.get(robot_name)
+        if cached is None:
+            pinocchio_model = self.robot.get_pinocchio_model()
+            # Interned names hit the identity fast path in dict lookups, which
+            # matters when ACM edits sweep O(links^2) pairs
+            user_link_names = [sys.intern(n) for n in pinocchio_model.get_link_names()]
+            user_joint_names = [
+                sys.intern(n) for n in pinocchio_model.get_joint_names()
+            ]
+            joint_types = pinocchio_model.get_joint_types()
+            limits_list = pinocchio_model.get_joint_limits()
+            joint_limits = np.empty((sum(map(len, limits_list)), 2))
+            np.concatenate(limits_list, out=joint_limits)
+            cached = (
+                pinocchio_model,
+                user_link_names,
+                user_joint_names,
+                joint_types,
+                joint_limits,
+            )
+            sapien_planning_world._planner_init_cache[robot_name] = cached
+        (
+            self.pinocchio_model,
+            self.user_link_names,
+            self.user_joint_names,
+            self.joint_types,
+            # Shared across planners built from this world; treated as read-only
+            self.joint_limits,
+        ) = cached
+        # Compact int8 codes replace the raw joint-class strings in per-joint
+        # tests: one vectorized bitmask AND instead of per-string prefix checks
+        self.joint_type_codes = np.fromiter(
+            (_jtype_code(t) for t in self.joint_types),
+            dtype=np.int8,
+            count=len(self.joint_types),
+        )
+        self.joint_is_revolute = (self.joint_type_codes & _JTYPE_REVOLUTE_BIT) != 0
 
-        self.joint_name_2_idx = {}
-        for i, joint in enumerate(self.user_joint_names):
-            self.joint_name_2_idx[joint] = i
-        self.link_name_2_idx = {}
-        for i, link in enumerate(self.user_link_names):
-            self.link_name_2_idx[link] = i
+        self.joint_name_2_idx = _name_index_map(tuple(self.user_joint_names))
+        self.link_name_2_idx = _name_index_map(tuple(self.user_link_names))
 
         assert (
             move_group in self.user_link_names
         ), f"end-effector not found as one of the links in {self.user_link_names}"
         self.move_group = move_group
-        self.robot.set_move_group(self.move_group)
-        self.move_group_joint_indices = self.robot.get_move_group_joint_indices()
+        # set_move_group recomputes the joint subset C++-side; skip it when a
+        # previous planner over this world already selected the same group
+        last_move_group = sapien_planning_world._last_move_group
+        if last_move_group.get(robot_name) != move_group:
+            self.robot.set_move_group(move_group)
+            last_move_group[robot_name] = move_group
+        # Contiguous int32 indices so downstream qpos[...] gathers stay in C
+        self.move_group_joint_indices = np.asarray(
+            self.robot.get_move_group_joint_indices(), dtype=np.int32
+        )
+        self._n_move_joints = self.move_group_joint_indices.size
 
-        self.joint_types = self.pinocchio_model.get_joint_types()
-        self.joint_limits = np.concatenate(self.pinocchio_model.get_joint_limits())
+        # Contiguous per-column views reused by the mask below and sampler code
+        self._joint_lo = self.joint_limits[:, 0]
+        self._joint_hi = self.joint_limits[:, 1]
         if joint_vel_limits is None:
-            joint_vel_limits = np.ones(len(self.move_group_joint_indices))
+            joint_vel_limits = np.ones(self._n_move_joints)
         if joint_acc_limits is None:
-            joint_acc_limits = np.ones(len(self.move_group_joint_indices))
-        self.joint_vel_limits = joint_vel_limits
-        self.joint_acc_limits = joint_acc_limits
+            joint_acc_limits = np.ones(self._n_move_joints)
+        # Typed contiguous buffers so time-parameterization loops do not
+        # re-coerce a Sequence/dtype on every use
+        self.joint_vel_limits = np.ascontiguousarray(joint_vel_limits, dtype=np.float64)
+        self.joint_acc_limits = np.ascontiguousarray(joint_acc_limits, dtype=np.float64)
         self.move_group_link_id = self.link_name_2_idx[self.move_group]
 
         # do a robot env collision check and warn if there is a collision
+        if check_initial_collision:
+            self.warn_initial_collisions()
+
+        if __debug__:  # explicit so `python -O` strips the whole block
+            nv = self.joint_vel_limits.shape[0]
+            na = self.joint_acc_limits.shape[0]
+            nj = self.joint_limits.shape[0]
+            assert nv == na == self._n_move_joints <= nj, (
+                "length of joint_vel_limits, joint_acc_limits, and "
+                "move_group_joint_indices should equal and be <= number of "
+                f"total joints. {nv} == {na} == {self._n_move_joints} <= {nj}"
+            )
+
+        # Mask for joints that have equivalent values (revolute joints with range > 2pi)
+        # Both operands are ndarrays, so the AND is a vectorized C loop over
+        # packed bools rather than a Python-level object-array conversion
+        self.equiv_joint_mask = self.joint_is_revolute & (
+            self._joint_hi - self._joint_lo > 2 * np.pi
+        )
+
+    @cached_property
+    def planner(self) -> OMPLPlanner:
+        """
+        The underlying OMPL planner, constructed lazily on first access.
+        FK-only or ACM-only uses of SapienPlanner never pay the cost of
+        building the OMPL state space and validity checker.
+        """
+        return OMPLPlanner(world=self.planning_world)
+
+    def warn_initial_collisions(self) -> None:
+        """
+        Runs a full robot collision check in the current state and warns about
+        every colliding link pair. One aggregated warn call amortizes the
+        warning-machinery overhead (filter traversal, stack inspection) over
+        all collisions.
+        """
         collisions = self.planning_world.check_robot_collision()
         if len(collisions):
+            # StringIO grows its buffer amortized, avoiding the intermediate
+            # strings of repeated concatenation/join for large collision sets
+            buf = io.StringIO()
+            buf.write(YELLOW_COLOR)
+            sep = ""
             for collision in collisions:
-                warnings.warn(
-                    YELLOW_COLOR + f"Robot's {collision.link_name1} collides with "
+                buf.write(
+                    f"{sep}Robot's {collision.link_name1} collides with "
                     f"{collision.link_name2} of {collision.object_name2} in initial "
-                    f"state. Use planner.planning_world.get_allowed_collision_matrix() "
-                    f"to disable collisions if planning fails" + RESET_COLOR,
-                    stacklevel=2,
+                    f"state. Use planner.planning_world.get_allowed_collision_matrix()"
+                    f" to disable collisions if planning fails"
                 )
+                sep = "\n"
+            buf.write(RESET_COLOR)
+            warnings.warn(buf.getvalue(), stacklevel=2)
 
-        assert (
-            len(self.joint_vel_limits)
-            == len(self.joint_acc_limits)
-            == len(self.move_group_joint_indices)
-            <= len(self.joint_limits)
-        ), (
-            "length of joint_vel_limits, joint_acc_limits, and move_group_joint_indices"
-            " should equal and be <= number of total joints. "
-            f"{len(self.joint_vel_limits)} == {len(self.joint_acc_limits)} "
-            f"== {len(self.move_group_joint_indices)} <= {len(self.joint_limits)}"
-        )
-
-        # Mask for joints that have equivalent values (revolute joints with range > 2pi)
-        self.equiv_joint_mask = [
-            t.startswith("JointModelR") for t in self.joint_types
-        ] & (self.joint_limits[:, 1] - self.joint_limits[:, 0] > 2 * np.pi)
-
-        self.planner = OMPLPlanner(world=self.planning_world)
+    def get_allowed_collision_matrix_view(self) -> np.ndarray:
+        """
+        Returns a dense NumPy bool matrix snapshot of the allowed collision
+        matrix, where ``view[i, j]`` is ``True`` iff collision between the
+        i-th and j-th entries is always allowed. Row/column indices per entry
+        name are stored in ``self.acm_row_of``.
+
+        Hot loops can then test ``acm_array[i, j]`` with a single C-level
+        array index instead of a Python-level ACM method call per pair. The
+        snapshot is rebuilt on every call; re-call after editing the ACM.
+        """
+        names = self.acm.get_all_entry_names()
+        self.acm_row_of = {name: i for i, name in enumerate(names)}
+        n = len(names)
+        self.acm_array = np.zeros((n, n), dtype=bool)
+        for i, name_i in enumerate(names):
+            for j in range(i + 1, n):
+                if (
+                    self.acm.get_allowed_collision(name_i, names[j])
+                    == AllowedCollision.ALWAYS
+                ):
+                    self.acm_array[i, j] = self.acm_array[j, i] = True
+        return self.acm_array
 
     def update_from_simulation(self, *, update_attached_object: bool = True) -> None:
         """
@@ -866,6 +1357,4 @@ class SapienPlanner(Planner):
         :param update_attached_object: whether to update the attached pose of
             all attached objects
         """
-        self.planning_world.update_from_simulation(
-            update_attached_object=update_attached_object
-        )
+        self._update_world(update_attached_object=update_attached_object)
@@ -35,8 +35,14 @@ void build_pyfcl_collision_common(py::module &m) {
            DOC(mplib, collision_detection, fcl, FCLObject, FCLObject, 2))
       .def_readonly("name", &FCLObject<S>::name,
                     DOC(mplib, collision_detection, fcl, FCLObject, name))
-      .def_property_readonly(
+      .def_property(
           "pose", [](const FCLObject<S> &fcl_obj) { return Pose<S>(fcl_obj.pose); },
+          [](FCLObject<S> &fcl_obj, const Pose<S> &pose) {
+            fcl_obj.pose = pose.toIsometry();
+            // Update pose of the shapes
+            for (size_t i = 0; i < fcl_obj.shapes.size(); i++)
+              fcl_obj.shapes[i]->setTransform(fcl_obj.pose * fcl_obj.shape_poses[i]);
+          },
           DOC(mplib, collision_detection, fcl, FCLObject, pose))
       .def_readonly("shapes", &FCLObject<S>::shapes,
                     DOC(mplib, collision_detection, fcl, FCLObject, shapes))
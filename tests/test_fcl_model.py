@@ -4,7 +4,15 @@ import unittest
 import numpy as np
 from transforms3d.quaternions import mat2quat
 
-from mplib.collision_detection.fcl import FCLModel
+from mplib import Pose
+from mplib.collision_detection.fcl import (
+    Box,
+    CollisionObject,
+    FCLModel,
+    FCLObject,
+    collide,
+    distance,
+)
 from mplib.kinematics.pinocchio import PinocchioModel
 
 FILE_ABS_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -67,5 +75,30 @@ class TestFCLModel(unittest.TestCase):
         self.assertEqual(len(collisions), 0)
 
 
+class TestFCLObjectPose(unittest.TestCase):
+    def setUp(self):
+        # Two unit boxes, each offset from its FCLObject origin by 0.5 along x
+        # so the pose setter must retransform the shapes, not just the object
+        self.shape_pose = Pose([0.5, 0, 0])
+        self.obj1 = FCLObject(
+            "obj1", Pose(), [CollisionObject(Box(1, 1, 1))], [self.shape_pose]
+        )
+        self.obj2 = FCLObject(
+            "obj2", Pose([5, 0, 0]), [CollisionObject(Box(1, 1, 1))], [self.shape_pose]
+        )
+
+    def test_pose_setter_updates_collision(self):
+        self.assertFalse(collide(self.obj1, self.obj2).is_collision())
+        # moving obj1 onto obj2 must be visible to the narrowphase
+        self.obj1.pose = Pose([5, 0, 0])
+        self.assertTrue(collide(self.obj1, self.obj2).is_collision())
+
+    def test_pose_setter_updates_distance(self):
+        # box centers sit at x=0.5 and x=5.5, so the gap between them is 4
+        self.assertAlmostEqual(distance(self.obj1, self.obj2).min_distance, 4, places=3)
+        self.obj1.pose = Pose([2, 0, 0])
+        self.assertAlmostEqual(distance(self.obj1, self.obj2).min_distance, 2, places=3)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -152,5 +152,71 @@ class TestSapienConversion(unittest.TestCase):
     """
 
 
+class TestCheckCollisionBatch(unittest.TestCase):
+    def setUp(self):
+        self.engine = sapien.Engine()
+        self.scene = self.engine.create_scene(sapien.SceneConfig())
+        self.scene.set_timestep(1 / 240)
+
+        loader: sapien.URDFLoader = self.scene.create_urdf_loader()
+        loader.fix_root_link = True
+        self.robot: sapien.Articulation = loader.load(PANDA_SPEC["urdf"])
+        self.robot.set_root_pose(sapien.Pose([0, 0, 0], [1, 0, 0, 0]))
+        self.robot.set_qpos([0, 0.19, 0.0, -2.61, 0.0, 2.94, 0.78, 0, 0])
+
+        def build_box(name, pose):
+            builder = self.scene.create_actor_builder()
+            builder.add_box_collision(half_size=[0.05, 0.05, 0.05])
+            box = builder.build(name=name)
+            box.set_pose(pose)
+            return box
+
+        # box_a and box_near overlap, far away from the robot; box_far is
+        # distant from everything; box_on_robot overlaps the robot base
+        self.box_a = build_box("box_a", sapien.Pose([2, 0, 0.05]))
+        self.box_near = build_box("box_near", sapien.Pose([2.04, 0, 0.05]))
+        self.box_far = build_box("box_far", sapien.Pose([10, 10, 0.05]))
+        self.box_on_robot = build_box("box_on_robot", sapien.Pose([0, 0, 0.05]))
+
+        self.planning_world = SapienPlanningWorld(self.scene, [self.robot])
+
+    def collision_pairs(self, results):
+        return sorted((r.object_name1, r.object_name2) for r in results)
+
+    def test_prefilter_keep_and_reject(self):
+        results = self.planning_world.check_collision_batch(
+            self.box_a, [self.box_near, self.box_far]
+        )
+        hit_names = {name for r in results for name in (r.object_name1, r.object_name2)}
+        # the touching pair must survive the bounding-sphere prefilter
+        self.assertIn(convert_object_name(self.box_near), hit_names)
+        # the distant pair is rejected by the prefilter (and does not collide)
+        self.assertNotIn(convert_object_name(self.box_far), hit_names)
+
+    def test_articulation_in_batch(self):
+        # articulations in objs_B bypass the prefilter and are still checked
+        results = self.planning_world.check_collision_batch(
+            self.box_on_robot, [self.robot, self.box_far]
+        )
+        self.assertGreater(len(results), 0)
+        results = self.planning_world.check_collision_batch(
+            self.box_far, [self.robot, self.box_a]
+        )
+        self.assertEqual(len(results), 0)
+
+    def test_agrees_with_pairwise(self):
+        for obj_A in [self.box_a, self.box_on_robot]:
+            objs_B = [self.box_near, self.box_far, self.robot]
+            batch = self.planning_world.check_collision_batch(obj_A, objs_B)
+            pairwise = []
+            for obj_B in objs_B:
+                pairwise.extend(
+                    self.planning_world.check_collision_between(obj_A, obj_B)
+                )
+            self.assertEqual(
+                self.collision_pairs(batch), self.collision_pairs(pairwise)
+            )
+
+
 if __name__ == "__main__":
     unittest.main()